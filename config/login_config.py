@@ -0,0 +1,18 @@
+import os
+import socket
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Login throttling configuration
+LOGIN_LIMIT_CONFIG = {
+    'terminal_id': os.getenv('ATM_TERMINAL_ID', socket.gethostname()),
+    'max_attempts': int(os.getenv('LOGIN_MAX_ATTEMPTS', '5')),
+    'terminal_max_attempts': int(os.getenv('LOGIN_TERMINAL_MAX_ATTEMPTS', '50')),
+    'window_seconds': int(os.getenv('LOGIN_WINDOW_SECONDS', '300')),
+    'base_lockout_seconds': int(os.getenv('LOGIN_BASE_LOCKOUT_SECONDS', '30')),
+    'max_lockout_seconds': int(os.getenv('LOGIN_MAX_LOCKOUT_SECONDS', '3600')),
+    'max_keys': int(os.getenv('LOGIN_MAX_TRACKED_KEYS', '10000')),
+    'shared': os.getenv('LOGIN_LIMIT_SHARED', 'false').lower() == 'true'
+}
@@ -63,6 +63,25 @@ class DatabaseHandler:
                 )
             """)
             
+            # Create login throttling tables
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS login_lockouts (
+                    lock_key VARCHAR(120) PRIMARY KEY,
+                    lockout_count INT NOT NULL DEFAULT 0,
+                    locked_until DOUBLE NOT NULL DEFAULT 0
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS login_failures (
+                    failure_id INT AUTO_INCREMENT PRIMARY KEY,
+                    lock_key VARCHAR(120) NOT NULL,
+                    attempted_at DOUBLE NOT NULL,
+                    INDEX (lock_key, attempted_at),
+                    INDEX (attempted_at)
+                )
+            """)
+            
             self.connection.commit()
             cursor.close()
             print("Tables created successfully")
@@ -166,4 +185,42 @@ class DatabaseHandler:
         """Check if a username already exists"""
         query = "SELECT COUNT(*) FROM users WHERE username = %s"
         result = self.execute_query(query, (username,))
-        return result[0][0] > 0 if result else False 
\ No newline at end of file
+        return result[0][0] > 0 if result else False
+
+    def get_users_after(self, account_id):
+        """Get (account_id, username) rows created after the given account_id"""
+        query = "SELECT account_id, username FROM users WHERE account_id > %s ORDER BY account_id"
+        result = self.execute_query(query, (account_id,))
+        return result if result else []
+
+    def get_login_lockout(self, lock_key):
+        """Get (lockout_count, locked_until) for a login throttling key"""
+        query = "SELECT lockout_count, locked_until FROM login_lockouts WHERE lock_key = %s"
+        result = self.execute_query(query, (lock_key,))
+        return (result[0][0], result[0][1]) if result else (0, 0.0)
+
+    def save_login_lockout(self, lock_key, lockout_count, locked_until):
+        """Persist the lockout state of a login throttling key"""
+        query = """
+        INSERT INTO login_lockouts (lock_key, lockout_count, locked_until)
+        VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE lockout_count = VALUES(lockout_count), locked_until = VALUES(locked_until)
+        """
+        return self.execute_query(query, (lock_key, lockout_count, locked_until), fetch=False)
+
+    def record_login_failure(self, lock_key, attempted_at, since):
+        """Record a failed login and drop failures older than the window for every key"""
+        self.execute_query("DELETE FROM login_failures WHERE attempted_at < %s", (since,), fetch=False)
+        query = "INSERT INTO login_failures (lock_key, attempted_at) VALUES (%s, %s)"
+        return self.execute_query(query, (lock_key, attempted_at), fetch=False)
+
+    def count_login_failures(self, lock_key, since):
+        """Count failed logins for a key since the given time"""
+        query = "SELECT COUNT(*) FROM login_failures WHERE lock_key = %s AND attempted_at >= %s"
+        result = self.execute_query(query, (lock_key, since))
+        return result[0][0] if result else 0
+
+    def clear_login_failures(self, lock_key):
+        """Remove all failed logins for a key"""
+        query = "DELETE FROM login_failures WHERE lock_key = %s"
+        return self.execute_query(query, (lock_key,), fetch=False) 
\ No newline at end of file
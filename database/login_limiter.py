@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict, deque
+
+
+class LoginRateLimiter:
+    def __init__(self, db, terminal_id, max_attempts=5, terminal_max_attempts=50, window_seconds=300,
+                 base_lockout_seconds=30, max_lockout_seconds=3600, max_keys=10000, shared=False):
+        self.db = db
+        self.terminal_id = terminal_id
+        self.max_attempts = max_attempts
+        # A terminal serves many customers, so it tolerates far more failures
+        # than a single username before locking out
+        self.terminal_max_attempts = terminal_max_attempts
+        self.window_seconds = window_seconds
+        self.base_lockout_seconds = base_lockout_seconds
+        self.max_lockout_seconds = max_lockout_seconds
+        self.max_keys = max_keys
+        # In shared mode failures and lockouts are read from the database so
+        # every terminal sees the same state
+        self.shared = shared
+        # Least recently used keys are evicted first to bound memory
+        self.states = OrderedDict()
+
+    def _keys(self, username):
+        """Return (key, max_attempts) pairs for the username and this terminal"""
+        return [(f"user:{username.lower()}", self.max_attempts),
+                (f"terminal:{self.terminal_id}", self.terminal_max_attempts)]
+
+    def _get_state(self, key, max_attempts):
+        """Get the state for a key, loading persisted lockouts on a cache miss"""
+        state = self.states.get(key)
+        if state is None or self.shared:
+            lockout_count, locked_until = self.db.get_login_lockout(key)
+            if state is None:
+                state = {'failures': deque(maxlen=max_attempts), 'lockout_count': 0, 'locked_until': 0.0}
+            state['lockout_count'] = lockout_count
+            state['locked_until'] = locked_until
+            self.states[key] = state
+            if len(self.states) > self.max_keys:
+                # Evicted lockouts are already persisted and reload on next use
+                self.states.popitem(last=False)
+        self.states.move_to_end(key)
+        return state
+
+    def _reset(self, key, state):
+        """Clear a key's failures and lockout history"""
+        state['failures'].clear()
+        if self.shared:
+            self.db.clear_login_failures(key)
+        if state['lockout_count']:
+            state['lockout_count'] = 0
+            state['locked_until'] = 0.0
+            self.db.save_login_lockout(key, 0, 0.0)
+
+    def check(self, username):
+        """Return seconds until a login may be attempted, or 0 if allowed"""
+        now = time.time()
+        wait = 0
+        for key, max_attempts in self._keys(username):
+            state = self._get_state(key, max_attempts)
+            wait = max(wait, state['locked_until'] - now)
+        return int(wait) + 1 if wait > 0 else 0
+
+    def record_failure(self, username):
+        """Count a failed login and lock out keys that exceed their limit"""
+        now = time.time()
+        since = now - self.window_seconds
+        for key, max_attempts in self._keys(username):
+            state = self._get_state(key, max_attempts)
+            if self.shared:
+                self.db.record_login_failure(key, now, since)
+                failures = self.db.count_login_failures(key, since)
+            else:
+                state['failures'].append(now)
+                while state['failures'] and state['failures'][0] < since:
+                    state['failures'].popleft()
+                failures = len(state['failures'])
+
+            if failures >= max_attempts:
+                # Lockout history is forgotten after a quiet period as long
+                # as the longest lockout
+                if state['locked_until'] and now - state['locked_until'] > self.max_lockout_seconds:
+                    state['lockout_count'] = 0
+                # Each lockout doubles in length up to the maximum
+                state['lockout_count'] += 1
+                lockout = self.base_lockout_seconds * 2 ** (state['lockout_count'] - 1)
+                state['locked_until'] = now + min(lockout, self.max_lockout_seconds)
+                state['failures'].clear()
+                if self.shared:
+                    self.db.clear_login_failures(key)
+                self.db.save_login_lockout(key, state['lockout_count'], state['locked_until'])
+
+    def record_success(self, username):
+        """Reset the username's failures and lockout history after a valid login"""
+        # The terminal is not reset, or any cardholder could keep it below its
+        # limit; its failures expire with the window and its lockouts after a
+        # quiet period instead
+        key, max_attempts = self._keys(username)[0]
+        self._reset(key, self._get_state(key, max_attempts))
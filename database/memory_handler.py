@@ -0,0 +1,107 @@
+from database.db_handler import DatabaseHandler
+
+
+class InMemoryDatabaseHandler(DatabaseHandler):
+    """Stand-in for DatabaseHandler that keeps users and transactions in memory.
+
+    Used to replay recorded sessions without a MySQL server. PIN hashing still
+    goes through bcrypt so login cost matches the real handler.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.users = {}
+        self.transactions = []
+        self.login_lockouts = {}
+        self.login_failures = {}
+        self.next_account_id = 1
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def add_account(self, account_id, username, hashed_pin, balance=0.0):
+        """Seed an account with a known ID and an already hashed PIN"""
+        self.users[account_id] = {
+            'username': username,
+            'pin_code': hashed_pin,
+            'balance': balance,
+        }
+        self.next_account_id = max(self.next_account_id, account_id + 1)
+
+    def create_user(self, username, pin_code):
+        """Create a new user with hashed PIN"""
+        if self.check_username_exists(username):
+            return False
+        hashed_pin = self.hash_pin(pin_code)
+        if not hashed_pin:
+            return False
+        self.users[self.next_account_id] = {'username': username, 'pin_code': hashed_pin, 'balance': 0.0}
+        self.next_account_id += 1
+        return True
+
+    def verify_user(self, username, pin_code):
+        """Verify user credentials and return account_id if valid"""
+        for account_id, user in self.users.items():
+            # Usernames compare case-insensitively, like the MySQL collation
+            if user['username'].lower() == username.lower():
+                return account_id if self.verify_pin(pin_code, user['pin_code']) else None
+        return None
+
+    def get_balance(self, account_id):
+        """Get user's current balance"""
+        user = self.users.get(account_id)
+        return user['balance'] if user else None
+
+    def update_balance(self, account_id, amount):
+        """Update user's balance"""
+        user = self.users.get(account_id)
+        if not user:
+            return False
+        user['balance'] += amount
+        return True
+
+    def record_transaction(self, sender_id, receiver_id, amount, transaction_type):
+        """Record a transaction in memory"""
+        self.transactions.append((sender_id, receiver_id, amount, transaction_type))
+        return True
+
+    def check_username_exists(self, username):
+        """Check if a username already exists"""
+        return any(user['username'].lower() == username.lower() for user in self.users.values())
+
+    def get_users_after(self, account_id):
+        """Get (account_id, username) rows created after the given account_id"""
+        return [(user_id, user['username']) for user_id, user in sorted(self.users.items())
+                if user_id > account_id]
+
+    def get_login_lockout(self, lock_key):
+        """Get (lockout_count, locked_until) for a login throttling key"""
+        return self.login_lockouts.get(lock_key, (0, 0.0))
+
+    def save_login_lockout(self, lock_key, lockout_count, locked_until):
+        """Store the lockout state of a login throttling key"""
+        self.login_lockouts[lock_key] = (lockout_count, locked_until)
+        return True
+
+    def record_login_failure(self, lock_key, attempted_at, since):
+        """Record a failed login and drop failures older than the window for every key"""
+        for key in list(self.login_failures):
+            failures = [t for t in self.login_failures[key] if t >= since]
+            if failures:
+                self.login_failures[key] = failures
+            else:
+                del self.login_failures[key]
+        self.login_failures.setdefault(lock_key, []).append(attempted_at)
+        return True
+
+    def count_login_failures(self, lock_key, since):
+        """Count failed logins for a key since the given time"""
+        return sum(1 for t in self.login_failures.get(lock_key, []) if t >= since)
+
+    def clear_login_failures(self, lock_key):
+        """Remove all failed logins for a key"""
+        self.login_failures.pop(lock_key, None)
+        return True
@@ -0,0 +1,91 @@
+from array import array
+from bisect import bisect_left
+
+
+class RecipientDirectory:
+    def __init__(self, db):
+        self.db = db
+        # Sorted account IDs with their usernames in a parallel list
+        self.account_ids = array('l')
+        self.usernames = []
+        # Lowercased username -> account_id for lookup by name
+        self.username_index = {}
+        self.last_account_id = 0
+        self.refresh()
+
+    def refresh(self):
+        """Load users created since the last refresh into the index"""
+        rows = self.db.get_users_after(self.last_account_id)
+        if not rows:
+            return 0
+
+        for account_id, username in rows:
+            # Account IDs are AUTO_INCREMENT, so new rows append at the end
+            if account_id <= self.last_account_id:
+                continue
+            self.account_ids.append(account_id)
+            self.usernames.append(username)
+            self.username_index[username.lower()] = account_id
+            self.last_account_id = account_id
+        return len(rows)
+
+    def _position(self, account_id):
+        """Return the index position of an account ID, or None if missing"""
+        pos = bisect_left(self.account_ids, account_id)
+        if pos < len(self.account_ids) and self.account_ids[pos] == account_id:
+            return pos
+        return None
+
+    def account_exists(self, account_id):
+        """Check if an account ID is in the directory"""
+        return self._position(account_id) is not None
+
+    def get_username(self, account_id):
+        """Get the username for an account ID"""
+        pos = self._position(account_id)
+        return self.usernames[pos] if pos is not None else None
+
+    def find_account_id(self, username):
+        """Get the account ID for a username"""
+        return self.username_index.get(username.strip().lower())
+
+    def _parse_account_id(self, text):
+        """Parse an account ID, returning None if the text is not one"""
+        if not text.isdecimal():
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            return None
+
+    def _matches(self, recipient):
+        """Return the distinct accounts a recipient input could refer to"""
+        recipient = recipient.strip()
+        if not recipient:
+            return []
+
+        # "#12" always means account ID 12
+        if recipient.startswith('#'):
+            account_id = self._parse_account_id(recipient[1:])
+            return [account_id] if account_id is not None and self.account_exists(account_id) else []
+
+        matches = []
+        account_id = self._parse_account_id(recipient)
+        if account_id is not None and self.account_exists(account_id):
+            matches.append(account_id)
+        # Usernames may also be all digits
+        account_id = self.find_account_id(recipient)
+        if account_id is not None and account_id not in matches:
+            matches.append(account_id)
+        return matches
+
+    def is_ambiguous(self, recipient):
+        """Check if a recipient input matches one account's ID and another's username"""
+        return len(self._matches(recipient)) > 1
+
+    def resolve(self, recipient):
+        """Resolve an account ID, #ID or username to (account_id, username)"""
+        matches = self._matches(recipient)
+        if len(matches) != 1:
+            return None
+        return matches[0], self.get_username(matches[0])
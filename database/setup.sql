@@ -21,4 +21,19 @@ CREATE TABLE IF NOT EXISTS transactions (
     transaction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (sender_id) REFERENCES users(account_id),
     FOREIGN KEY (receiver_id) REFERENCES users(account_id)
+);
+
+-- Create login throttling tables
+CREATE TABLE IF NOT EXISTS login_lockouts (
+    lock_key VARCHAR(120) PRIMARY KEY,
+    lockout_count INT NOT NULL DEFAULT 0,
+    locked_until DOUBLE NOT NULL DEFAULT 0  -- Unix timestamp
+);
+
+CREATE TABLE IF NOT EXISTS login_failures (
+    failure_id INT AUTO_INCREMENT PRIMARY KEY,
+    lock_key VARCHAR(120) NOT NULL,
+    attempted_at DOUBLE NOT NULL,  -- Unix timestamp
+    INDEX (lock_key, attempted_at),
+    INDEX (attempted_at)  -- Used to purge expired failures
 ); 
\ No newline at end of file
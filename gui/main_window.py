@@ -4,12 +4,18 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QPushButton,
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QFont, QPalette, QColor
 from database.db_handler import DatabaseHandler
+from database.recipient_directory import RecipientDirectory
+from database.login_limiter import LoginRateLimiter
+from config.login_config import LOGIN_LIMIT_CONFIG
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, db=None, recorder=None, login_limiter=None):
         super().__init__()
-        self.db = DatabaseHandler()
+        self.db = db or DatabaseHandler()
+        self.recipients = RecipientDirectory(self.db)
+        self.login_limiter = login_limiter or LoginRateLimiter(self.db, **LOGIN_LIMIT_CONFIG)
         self.current_user_id = None
+        self.recorder = recorder
         
         # Set window to full screen and remove window frame
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
@@ -19,9 +25,16 @@ class MainWindow(QMainWindow):
         screen = self.screen().geometry()
         self.setGeometry(screen)
         
+        # Actions must be wrapped before the buttons are connected to them
+        if self.recorder:
+            self.recorder.attach(self)
+
         self.init_ui()
         self.setup_styles()
 
+        if self.recorder:
+            self.recorder.watch_navigation()
+
     def setup_styles(self):
         """Setup the application-wide styles"""
         # Set application-wide styles
@@ -282,7 +295,7 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(withdraw_btn)
 
         transfer_btn = QPushButton("Transfer")
-        transfer_btn.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.transfer_screen))
+        transfer_btn.clicked.connect(self.show_transfer)
         button_layout.addWidget(transfer_btn)
 
         logout_btn = QPushButton("Logout")
@@ -342,11 +355,16 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QVBoxLayout()
 
-        recipient_label = QLabel("Recipient Account ID:")
+        recipient_label = QLabel("Recipient Account ID or Username:")
         self.recipient_input = QLineEdit()
+        self.recipient_input.textChanged.connect(self.update_recipient_lookup)
         layout.addWidget(recipient_label)
         layout.addWidget(self.recipient_input)
 
+        self.recipient_name_label = QLabel()
+        self.recipient_name_label.setStyleSheet("font-size: 24px; color: #aaaaaa;")
+        layout.addWidget(self.recipient_name_label)
+
         amount_label = QLabel("Amount to Transfer:")
         self.transfer_amount_input = QLineEdit()
         layout.addWidget(amount_label)
@@ -403,13 +421,21 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter both username and PIN code")
             return
 
+        # Reject throttled attempts before spending time on PIN hashing
+        wait = self.login_limiter.check(username)
+        if wait:
+            QMessageBox.warning(self, "Error", f"Too many failed attempts. Try again in {wait} seconds")
+            return
+
         account_id = self.db.verify_user(username, pin_code)
         if account_id:
+            self.login_limiter.record_success(username)
             self.current_user_id = account_id
             self.stacked_widget.setCurrentWidget(self.user_menu)
             self.username_input.clear()
             self.pin_input.clear()
         else:
+            self.login_limiter.record_failure(username)
             QMessageBox.warning(self, "Error", "Invalid username or PIN code")
 
     def handle_activate_card(self):
@@ -430,6 +456,7 @@ class MainWindow(QMainWindow):
             return
 
         if self.db.create_user(username, pin_code):
+            self.recipients.refresh()
             QMessageBox.information(self, "Success", "Card activated successfully!")
             self.stacked_widget.setCurrentWidget(self.main_menu)
             self.new_username_input.clear()
@@ -483,15 +510,51 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "Error", "Failed to process withdrawal")
 
+    def show_transfer(self):
+        """Show the transfer screen with an up to date recipient directory"""
+        self.recipients.refresh()
+        self.stacked_widget.setCurrentWidget(self.transfer_screen)
+
+    def update_recipient_lookup(self, text):
+        """Show the matching recipient as the user types"""
+        if not text.strip():
+            self.recipient_name_label.clear()
+            return
+
+        recipient = self.recipients.resolve(text)
+        if recipient:
+            account_id, username = recipient
+            self.recipient_name_label.setText(f"Recipient: {username} (#{account_id})")
+        elif self.recipients.is_ambiguous(text):
+            self.recipient_name_label.setText("Ambiguous recipient, use #ID for an account ID")
+        else:
+            self.recipient_name_label.setText("Recipient not found")
+
     def handle_transfer(self):
         """Handle transfer transaction"""
         try:
-            recipient_id = int(self.recipient_input.text())
             amount = float(self.transfer_amount_input.text())
             if amount <= 0:
                 raise ValueError
         except ValueError:
-            QMessageBox.warning(self, "Error", "Please enter valid recipient ID and amount")
+            QMessageBox.warning(self, "Error", "Please enter a valid amount")
+            return
+
+        recipient = self.recipients.resolve(self.recipient_input.text())
+        if not recipient:
+            # The account may have been created from another terminal
+            self.recipients.refresh()
+            recipient = self.recipients.resolve(self.recipient_input.text())
+        if not recipient and self.recipients.is_ambiguous(self.recipient_input.text()):
+            QMessageBox.warning(self, "Error", "Ambiguous recipient, use #ID for an account ID")
+            return
+        if not recipient:
+            QMessageBox.warning(self, "Error", "Recipient account not found")
+            return
+        recipient_id = recipient[0]
+
+        if recipient_id == self.current_user_id:
+            QMessageBox.warning(self, "Error", "Cannot transfer to your own account")
             return
 
         current_balance = self.db.get_balance(self.current_user_id)
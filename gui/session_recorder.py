@@ -0,0 +1,164 @@
+import json
+import time
+
+# Screens that can be navigated to, by MainWindow attribute name
+SCREENS = [
+    'main_menu',
+    'login_screen',
+    'activate_card_screen',
+    'user_menu',
+    'deposit_screen',
+    'withdraw_screen',
+    'transfer_screen',
+    'check_balance_screen',
+]
+
+# User actions and the input fields each one reads
+ACTIONS = {
+    'handle_login': ['username_input', 'pin_input'],
+    'handle_activate_card': ['new_username_input', 'new_pin_input'],
+    'handle_logout': [],
+    'handle_deposit': ['deposit_amount_input'],
+    'handle_withdraw': ['withdraw_amount_input'],
+    'handle_transfer': ['recipient_input', 'transfer_amount_input'],
+    'show_check_balance': [],
+}
+
+TRACE_VERSION = 1
+
+# Real PINs are never written to a trace. A PIN that worked is replaced with
+# REPLAY_PIN, which every replayed account accepts; one that failed with WRONG_PIN.
+REPLAY_PIN = '0000'
+WRONG_PIN = '9999'
+
+
+class SessionRecorder:
+    def __init__(self, path):
+        self.path = path
+        self.window = None
+        self.events = []
+        # Only accounts the session touches are recorded, by account_id
+        self.accounts = {}
+        # Accounts activated during the session are created again on replay
+        self.created_account_ids = set()
+        self.start_time = None
+        self.in_action = False
+
+    def attach(self, window):
+        """Wrap the window's actions; call before the UI is built"""
+        self.window = window
+        self.start_time = time.perf_counter()
+        for name in ACTIONS:
+            setattr(window, name, self._wrap_action(name, getattr(window, name)))
+
+    def watch_navigation(self):
+        """Record screen changes; call after the UI is built"""
+        self.window.stacked_widget.currentChanged.connect(self.record_navigation)
+
+    def _elapsed_ms(self):
+        return int((time.perf_counter() - self.start_time) * 1000)
+
+    def _wrap_action(self, name, handler):
+        def wrapper(*args):
+            inputs = {field: getattr(self.window, field).text() for field in ACTIONS[name]}
+            timestamp = self._elapsed_ms()
+            details = self._before_action(name, inputs)
+            self.in_action = True
+            try:
+                handler()
+            finally:
+                self.in_action = False
+            self._after_action(name, inputs, details)
+            event = ['act', timestamp, name, self._redact(name, inputs)]
+            if details:
+                event.append(details)
+            self.events.append(event)
+        return wrapper
+
+    def _before_action(self, name, inputs):
+        """Capture state the replay needs to take the same path as the recording"""
+        details = {}
+        if name == 'handle_login' and self.window.login_limiter.check(inputs['username_input']):
+            details['throttled'] = True
+        elif name == 'handle_activate_card':
+            details['existed'] = self.window.recipients.find_account_id(inputs['new_username_input']) is not None
+        return details
+
+    def _after_action(self, name, inputs, details):
+        """Record accounts the action created or referenced"""
+        if name == 'handle_activate_card':
+            existed = details.pop('existed')
+            account_id = self.window.recipients.find_account_id(inputs['new_username_input'])
+            if not existed and account_id is not None:
+                # Replay creates the account under the same ID
+                self.created_account_ids.add(account_id)
+                details['account_id'] = account_id
+        else:
+            self._record_accounts(name, inputs)
+
+    def _record_accounts(self, name, inputs):
+        """Remember existing accounts an action referenced so replay can seed them"""
+        recipients = self.window.recipients
+        if name == 'handle_login':
+            username = inputs['username_input']
+            account_id = self.window.current_user_id or recipients.find_account_id(username)
+            if account_id is not None and account_id not in self.created_account_ids:
+                self.accounts[account_id] = recipients.get_username(account_id) or username
+        elif name == 'handle_transfer':
+            # The transfer has already refreshed the directory if it needed to
+            recipient = recipients.resolve(inputs['recipient_input'])
+            if recipient and recipient[0] not in self.created_account_ids:
+                account_id, username = recipient
+                self.accounts[account_id] = username
+
+    def _redact(self, name, inputs):
+        """Replace PIN values so traces can be shared safely"""
+        if name == 'handle_login' and inputs['pin_input']:
+            logged_in = self.window.current_user_id is not None
+            inputs['pin_input'] = REPLAY_PIN if logged_in else WRONG_PIN
+        elif name == 'handle_activate_card':
+            pin_code = inputs['new_pin_input']
+            if len(pin_code) == 4 and pin_code.isdigit():
+                inputs['new_pin_input'] = REPLAY_PIN
+            else:
+                # Keep the length so invalid PINs stay invalid on replay
+                inputs['new_pin_input'] = 'x' * len(pin_code)
+        return inputs
+
+    def record_navigation(self, index):
+        """Record a screen change made directly by the user"""
+        # Navigation caused by an action is reproduced by replaying the action
+        if self.in_action:
+            return
+        widget = self.window.stacked_widget.widget(index)
+        for screen in SCREENS:
+            if getattr(self.window, screen) is widget:
+                self.events.append(['nav', self._elapsed_ms(), screen])
+                return
+
+    def save(self):
+        """Write the trace as JSON lines: a header, then one event per line.
+
+        Action events are [kind, ms, action, inputs] with an optional details
+        dict holding 'throttled' for logins and 'account_id' for activations.
+        """
+        with open(self.path, 'w') as trace_file:
+            accounts = [[account_id, username] for account_id, username in sorted(self.accounts.items())]
+            header = {'version': TRACE_VERSION, 'accounts': accounts}
+            trace_file.write(json.dumps(header, separators=(',', ':')) + '\n')
+            for event in self.events:
+                trace_file.write(json.dumps(event, separators=(',', ':')) + '\n')
+        print(f"Session trace saved to {self.path} ({len(self.events)} events)")
+
+
+def load_trace(path):
+    """Load a trace file and return (header, events)"""
+    with open(path) as trace_file:
+        lines = [line for line in trace_file if line.strip()]
+    if not lines:
+        raise ValueError(f"Empty session trace: {path}")
+
+    header = json.loads(lines[0])
+    if header.get('version') != TRACE_VERSION:
+        raise ValueError(f"Unsupported session trace version: {header.get('version')}")
+    return header, [json.loads(line) for line in lines[1:]]
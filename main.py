@@ -1,13 +1,23 @@
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
 from gui.main_window import MainWindow
+from gui.session_recorder import SessionRecorder
 
 def main():
     """Main function to start the application"""
     app = QApplication(sys.argv)
-    window = MainWindow()
+
+    # Record the session to a trace file for replay_session.py if requested
+    trace_path = os.getenv('ATM_SESSION_TRACE')
+    recorder = SessionRecorder(trace_path) if trace_path else None
+
+    window = MainWindow(recorder=recorder)
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    if recorder:
+        recorder.save()
+    sys.exit(exit_code)
 
 if __name__ == '__main__':
     main() 
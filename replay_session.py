@@ -0,0 +1,128 @@
+import os
+import sys
+import time
+
+# Replays run without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+from database.memory_handler import InMemoryDatabaseHandler
+from gui.main_window import MainWindow
+from gui.session_recorder import REPLAY_PIN, load_trace
+
+# Time budget for one frame at 60 FPS
+FRAME_BUDGET_MS = 1000 / 60
+DEFAULT_BALANCE = 1000.0
+
+
+class ReplayLoginLimiter:
+    """Login limiter that throttles exactly the attempts throttled while recording"""
+
+    def __init__(self):
+        self.throttled = False
+
+    def check(self, username):
+        return 1 if self.throttled else 0
+
+    def record_failure(self, username):
+        pass
+
+    def record_success(self, username):
+        pass
+
+
+def percentile(values, fraction):
+    """Get a percentile from a list of values"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def replay(path, balance=DEFAULT_BALANCE):
+    """Replay a session trace and return per-action timings in milliseconds"""
+    header, events = load_trace(path)
+
+    db = InMemoryDatabaseHandler()
+    # Every seeded account shares one PIN, so hash it only once
+    hashed_pin = db.hash_pin(REPLAY_PIN)
+    for account_id, username in header['accounts']:
+        db.add_account(account_id, username, hashed_pin, balance)
+
+    # Message boxes are modal and would block the replay, so record them instead
+    messages = []
+    QMessageBox.warning = staticmethod(lambda parent, title, text, *args: messages.append((title, text)))
+    QMessageBox.information = staticmethod(lambda parent, title, text, *args: messages.append((title, text)))
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    # Replaying at full speed would trip a real limiter at different points
+    login_limiter = ReplayLoginLimiter()
+    window = MainWindow(db=db, login_limiter=login_limiter)
+    window.show()
+    app.processEvents()
+
+    timings = {}
+    for event in events:
+        kind = event[0]
+        start = time.perf_counter()
+        if kind == 'nav':
+            name = 'nav:' + event[2]
+            window.stacked_widget.setCurrentWidget(getattr(window, event[2]))
+            handler_end = time.perf_counter()
+        elif kind == 'act':
+            name = event[2]
+            details = event[4] if len(event) > 4 else {}
+            login_limiter.throttled = details.get('throttled', False)
+            if 'account_id' in details:
+                # Give the activated account the ID it had when recorded
+                db.next_account_id = details['account_id']
+            # Filling inputs runs the textChanged slots, such as the recipient
+            # lookup, so it counts towards the action and gets its own row too
+            for field, value in event[3].items():
+                getattr(window, field).setText(value)
+            if event[3]:
+                fill_ms = (time.perf_counter() - start) * 1000
+                timings.setdefault('input:' + name, []).append({'latency': fill_ms, 'blocked': fill_ms})
+            getattr(window, name)()
+            handler_end = time.perf_counter()
+        else:
+            raise ValueError(f"Unknown trace event: {kind}")
+
+        # Let Qt lay out and paint the result before stopping the clock
+        app.processEvents()
+        end = time.perf_counter()
+        timings.setdefault(name, []).append({
+            'latency': (end - start) * 1000,
+            'blocked': (handler_end - start) * 1000,
+        })
+
+    window.close()
+    return timings, messages
+
+
+def print_report(timings):
+    """Print latency and frame-blocking statistics per action"""
+    print(f"{'action':<28}{'count':>7}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}"
+          f"{'blocked ms':>12}{'missed frames':>15}")
+    for name, samples in sorted(timings.items()):
+        latencies = [sample['latency'] for sample in samples]
+        blocked = sum(sample['blocked'] for sample in samples)
+        missed = sum(int(sample['blocked'] // FRAME_BUDGET_MS) for sample in samples)
+        print(f"{name:<28}{len(samples):>7}{sum(latencies) / len(latencies):>10.2f}"
+              f"{percentile(latencies, 0.95):>10.2f}{max(latencies):>10.2f}"
+              f"{blocked:>12.2f}{missed:>15}")
+
+
+def main():
+    """Replay the session traces given on the command line"""
+    if len(sys.argv) < 2:
+        print("Usage: python replay_session.py TRACE [TRACE ...]")
+        sys.exit(1)
+
+    for path in sys.argv[1:]:
+        print(f"Replaying {path}")
+        timings, messages = replay(path)
+        print_report(timings)
+        print(f"{len(messages)} message boxes shown")
+
+if __name__ == '__main__':
+    main()